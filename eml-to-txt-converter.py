@@ -5,29 +5,43 @@ and extracts all attachments
 """
 
 import os
+import re
 import sys
-import email
-import base64
-import quopri
+import binascii
+import functools
+from email import policy
+from email.errors import HeaderParseError
 from email.header import decode_header
+from email.parser import BytesParser
 import argparse
 from pathlib import Path
 import mimetypes
+from concurrent.futures import ProcessPoolExecutor
 
 
-def decode_content(content, encoding):
-    """Decode content based on Content-Transfer-Encoding"""
-    if encoding == 'base64':
-        try:
-            return base64.b64decode(content).decode('utf-8', errors='replace')
-        except:
-            return "[BASE64 ENCODED BINARY CONTENT - NOT DISPLAYED]"
-    elif encoding == 'quoted-printable':
-        return quopri.decodestring(content).decode('utf-8', errors='replace')
-    elif encoding == '7bit' or encoding == '8bit' or encoding is None:
-        return content
-    else:
-        return f"[UNKNOWN ENCODING: {encoding}]"
+# An RFC 2047 encoded word like =?utf-8?q?text?=
+_ENCODED_WORD = re.compile(r'=\?[^?]*\?[qQbB]\?.*?\?=')
+
+# Characters that might be problematic in filenames, all mapped to '_'
+_SANITIZE_TABLE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+
+# Headers included in the output, keyed by lowercase name since header names are case-insensitive
+_IMPORTANT_HEADERS = {name.lower(): name for name in ('From', 'To', 'Cc', 'Bcc', 'Subject', 'Date')}
+
+# Size of the slices attachments are decoded and written in
+_CHUNK_SIZE = 64 * 1024
+
+# Parser shared by all emails, it keeps no state between messages
+_PARSER = BytesParser(policy=policy.default)
+
+# Emails up to this size are read in one go before parsing
+_MAX_SINGLE_READ_SIZE = 8 * 1024 * 1024
+
+# Number of progress messages collected before they are written to stdout
+_PROGRESS_BATCH_SIZE = 64
+
+# Load the mimetypes database once up front rather than on the first attachment
+mimetypes.init()
 
 
 def decode_header_value(header_value):
@@ -35,44 +49,130 @@ def decode_header_value(header_value):
     if header_value is None:
         return ""
     
+    return _decode_header_cached(header_value)
+
+
+@functools.lru_cache(maxsize=4096)
+def _decode_header_cached(header_value):
+    """Cached decoding for header strings that repeat across messages"""
+    # Unfold continuation lines of raw header values
+    header_value = header_value.replace('\r', '').replace('\n', '')
+    # Raw 8-bit bytes come out of the parser as surrogate escapes, read them as utf-8
+    header_value = header_value.encode('utf-8', errors='surrogateescape').decode('utf-8', errors='replace')
+    return _decode_header(header_value)
+
+
+def _decode_header(header_value):
+    """Decode the encoded words in a header value, leaving the text around them as is"""
+    decoded_parts = []
+    pos = 0
+    for match in _ENCODED_WORD.finditer(header_value):
+        text = header_value[pos:match.start()]
+        # Whitespace between adjacent encoded words is not part of the value
+        if not (pos and text.isspace()):
+            decoded_parts.append(text)
+        decoded_parts.append(_decode_encoded_word(match.group()))
+        pos = match.end()
+    decoded_parts.append(header_value[pos:])
+    
+    return ''.join(decoded_parts)
+
+
+def _decode_encoded_word(word):
+    """Decode a single RFC 2047 encoded word, keeping it unchanged if it is malformed"""
+    try:
+        parts = decode_header(word)
+    except HeaderParseError:
+        return word
+    
     decoded_parts = []
-    for part, encoding in decode_header(header_value):
+    for part, encoding in parts:
         if isinstance(part, bytes):
-            if encoding:
-                try:
-                    decoded_parts.append(part.decode(encoding, errors='replace'))
-                except LookupError:
-                    decoded_parts.append(part.decode('utf-8', errors='replace'))
-            else:
+            try:
+                decoded_parts.append(part.decode(encoding or 'ascii', errors='replace'))
+            except LookupError:
                 decoded_parts.append(part.decode('utf-8', errors='replace'))
         else:
             decoded_parts.append(part)
-    
-    return ' '.join(decoded_parts)
+    return ''.join(decoded_parts)
 
 
+@functools.lru_cache(maxsize=4096)
 def sanitize_filename(filename):
     """Sanitize filename to avoid issues with invalid characters"""
     # Replace characters that might be problematic in filenames
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
+    filename = filename.translate(_SANITIZE_TABLE)
     
-    # Limit filename length
-    if len(filename) > 200:
+    # Limit filename length in bytes, which is what filesystem limits apply to
+    if len(filename.encode('utf-8', errors='surrogateescape')) > 200:
         name, ext = os.path.splitext(filename)
-        filename = name[:195] + ext
+        budget = max(200 - len(ext.encode('utf-8', errors='surrogateescape')), 0)
+        # Drop a multi-byte character cut in half by the slice instead of keeping broken bytes
+        name = name.encode('utf-8', errors='surrogateescape')[:budget].decode('utf-8', errors='ignore')
+        filename = name + ext
         
     return filename
 
 
+@functools.lru_cache(maxsize=256)
+def _guess_extension(content_type):
+    """Guess a file extension for a content type, cached per content type"""
+    return mimetypes.guess_extension(content_type) or '.bin'
+
+
+def _iter_payload_chunks(payload):
+    """Split an encoded payload into ASCII chunks of about _CHUNK_SIZE ending on a line break"""
+    start = 0
+    while start < len(payload):
+        end = payload.find('\n', start + _CHUNK_SIZE)
+        end = len(payload) if end == -1 else end + 1
+        yield payload[start:end].encode('ascii')
+        start = end
+
+
+def _write_payload(part, f):
+    """Decode the payload of a part into an open file chunk by chunk, returns the bytes written"""
+    encoding = str(part.get('Content-Transfer-Encoding', '')).lower()
+    payload = part.get_payload(decode=False)
+    
+    if isinstance(payload, str) and encoding in ('base64', 'quoted-printable'):
+        written = 0
+        pending = b''
+        try:
+            for chunk in _iter_payload_chunks(payload):
+                if encoding == 'base64':
+                    # Only decode complete 4 character groups, keep the rest for the next chunk
+                    chunk = pending + b''.join(chunk.split())
+                    usable = len(chunk) - len(chunk) % 4
+                    chunk, pending = chunk[:usable], chunk[usable:]
+                    data = binascii.a2b_base64(chunk)
+                else:
+                    data = binascii.a2b_qp(chunk)
+                f.write(data)
+                written += len(data)
+            if not pending:
+                return written
+        except ValueError:
+            pass
+        
+        # Malformed or non-ASCII payload, start over and let the email package deal with it
+        f.seek(0)
+        f.truncate()
+    
+    payload = part.get_payload(decode=True)
+    if payload:
+        f.write(payload)
+        return len(payload)
+    return 0
+
+
 def extract_attachment(part, attachments_dir, email_name):
     """Extract attachment from email part and save to disk"""
     filename = part.get_filename()
     if not filename:
         # Generate a filename if none is provided
         content_type = part.get_content_type()
-        ext = mimetypes.guess_extension(content_type) or '.bin'
+        ext = _guess_extension(content_type)
         filename = f"unnamed_attachment_{content_type.replace('/', '_')}{ext}"
     
     # Decode and sanitize the filename
@@ -80,30 +180,50 @@ def extract_attachment(part, attachments_dir, email_name):
     filename = sanitize_filename(filename)
     
     # Create a unique filename with email name prefix to avoid conflicts
-    email_prefix = email_name.split('.')[0]
+    email_prefix = email_name.partition('.')[0]
     unique_filename = f"{email_prefix}_{filename}"
     file_path = Path(attachments_dir) / unique_filename
     
+    # Nested messages have no payload of their own to save
+    if part.is_multipart():
+        return None
+    
     # Extract and save the attachment
-    payload = part.get_payload(decode=True)
-    if payload:
-        with open(file_path, 'wb') as f:
-            f.write(payload)
-        
+    with open(file_path, 'wb') as f:
+        size = _write_payload(part, f)
+    
+    if size:
         return {
             'filename': unique_filename,
             'original_filename': filename,
-            'size': len(payload),
+            'size': size,
             'content_type': part.get_content_type(),
             'path': file_path
         }
+    file_path.unlink()
     return None
 
 
+def _estimate_payload_size(part):
+    """Estimate the decoded size of a payload without decoding it"""
+    payload = part.get_payload(decode=False)
+    if not isinstance(payload, str):
+        # Nested messages have no payload of their own
+        return 0
+    
+    if str(part.get('Content-Transfer-Encoding', '')).lower() == 'base64':
+        # Every 4 base64 characters encode 3 bytes. Line breaks (LF or CRLF) and other
+        # whitespace carry no data, and each trailing '=' pads out one missing byte.
+        data_chars = len(payload) - sum(map(payload.count, '\r\n \t'))
+        padding = payload[-8:].count('=')
+        return data_chars * 3 // 4 - padding
+    return len(payload)
+
+
 def get_attachment_info(part, attachments_dir=None, email_name=None, extract=False):
     """Extract attachment information and optionally save attachment to disk"""
     if part.get_filename() or part.get_content_disposition() in ['attachment', 'inline']:
-        content_type = part.get_content_type()
+        content_type = sys.intern(part.get_content_type())
         
         # Skip if this is part of the email structure, not a real attachment
         if content_type in ['multipart/alternative', 'multipart/related', 'multipart/mixed']:
@@ -111,18 +231,22 @@ def get_attachment_info(part, attachments_dir=None, email_name=None, extract=Fal
             
         filename = part.get_filename()
         if not filename:
-            ext = mimetypes.guess_extension(content_type) or '.bin'
+            ext = _guess_extension(content_type)
             filename = f"unnamed_attachment{ext}"
         else:
             filename = decode_header_value(filename)
         
-        size = len(part.get_payload(decode=False))
-        
         # Extract attachment if requested
         extracted_info = None
         if extract and attachments_dir and email_name:
             extracted_info = extract_attachment(part, attachments_dir, email_name)
         
+        # The decoded size is known once extracted, otherwise estimate it from the encoded payload
+        if extracted_info:
+            size = extracted_info['size']
+        else:
+            size = _estimate_payload_size(part)
+        
         info = f"[ATTACHMENT: {filename} ({content_type}, ~{size/1024:.1f} KB)]"
         if extracted_info:
             info += f" - Saved as: {extracted_info['filename']}"
@@ -134,44 +258,48 @@ def get_attachment_info(part, attachments_dir=None, email_name=None, extract=Fal
     return None
 
 
-def process_eml_file(eml_path, output_path=None, attachments_dir=None, extract_attachments=False):
-    """Process a single EML file and convert it to human-readable text"""
-    if output_path is None:
-        output_path = eml_path.with_suffix('.txt')
+def _emit_lines(msg, email_name, attachments_dir, extract_attachments, extracted_attachments):
+    """Yield the converted text of an email piece by piece, every line ending in a newline
     
-    # Create attachments directory if needed
-    if extract_attachments and attachments_dir:
-        Path(attachments_dir).mkdir(parents=True, exist_ok=True)
+    Attachments saved to disk along the way are appended to extracted_attachments.
+    """
+    # Start with headers
+    yield "=" * 80 + "\n"
+    yield f"EMAIL: {email_name}\n"
+    yield "=" * 80 + "\n"
+    yield "\n"
     
-    with open(eml_path, 'rb') as f:
-        msg = email.message_from_binary_file(f)
+    # Collect key headers in one pass over the raw headers. They are decoded from the raw
+    # value rather than through the policy, whose address parser rewrites malformed
+    # headers and can even raise on them.
+    found_headers = {}
+    for name, value in msg.raw_items():
+        header = _IMPORTANT_HEADERS.get(name.lower())
+        if header and header not in found_headers:
+            found_headers[header] = value
     
-    # Start with headers
-    output = []
-    output.append("=" * 80)
-    output.append(f"EMAIL: {eml_path.name}")
-    output.append("=" * 80)
-    output.append("")
-    
-    # Process key headers with proper decoding
-    important_headers = ['From', 'To', 'Cc', 'Bcc', 'Subject', 'Date']
-    for header in important_headers:
-        if header in msg:
-            decoded_value = decode_header_value(msg[header])
-            output.append(f"{header}: {decoded_value}")
-    
-    output.append("")
-    output.append("-" * 80)
-    output.append("")
-    
-    # Process body and attachments
-    body_text = []
+    for header in _IMPORTANT_HEADERS.values():
+        if header in found_headers:
+            decoded_value = decode_header_value(found_headers[header])
+            yield f"{header}: {decoded_value}\n"
+    
+    yield "\n"
+    yield "-" * 80 + "\n"
+    yield "\n"
+    
+    # Process body and attachments. Body text is emitted as it is found, attachment
+    # information is only known completely once all parts have been seen.
     attachment_info = []
-    extracted_attachments = []
+    body_started = False
     
-    # Function to process message parts recursively
-    def extract_parts(message_part):
-        content_type = message_part.get_content_type()
+    # Process message parts depth-first with an explicit stack. Parts that are handled
+    # as attachments (like forwarded messages) are not descended into.
+    pending_parts = list(reversed(msg.get_payload())) if msg.is_multipart() else [msg]
+    while pending_parts:
+        message_part = pending_parts.pop()
+        
+        # Interned so the comparisons against the known type literals below are identity checks
+        content_type = sys.intern(message_part.get_content_type())
         content_disposition = str(message_part.get('Content-Disposition', ''))
         
         # Handle attachments
@@ -180,60 +308,84 @@ def process_eml_file(eml_path, output_path=None, attachments_dir=None, extract_a
             attachment = get_attachment_info(
                 message_part, 
                 attachments_dir=attachments_dir, 
-                email_name=eml_path.name,
+                email_name=email_name,
                 extract=extract_attachments
             )
             if attachment:
                 attachment_info.append(attachment['info_text'])
                 if attachment.get('extracted'):
                     extracted_attachments.append(attachment['extracted'])
-            return
+            continue
         
         # Handle message body parts
         if content_type == 'text/plain':
-            content = message_part.get_payload(decode=True)
+            # get_payload already undoes base64/quoted-printable, only the charset is left
+            content = message_part.get_payload(decode=True) or b''
             charset = message_part.get_content_charset() or 'utf-8'
-            encoding = message_part.get('Content-Transfer-Encoding')
             
             try:
-                decoded_text = content.decode(charset, errors='replace')
-                body_text.append(decoded_text)
-            except:
-                decoded_text = decode_content(content, encoding)
-                body_text.append(decoded_text)
+                text = content.decode(charset, errors='replace')
+            except LookupError:
+                # Unknown charset, fall back to utf-8
+                text = content.decode('utf-8', errors='replace')
                 
         elif content_type == 'text/html':
             # Just note that there was HTML content
-            body_text.append("\n[HTML CONTENT AVAILABLE BUT NOT DISPLAYED]\n")
+            text = "\n[HTML CONTENT AVAILABLE BUT NOT DISPLAYED]\n"
             
-        # Process multipart messages recursively
+        # Queue the subparts of multipart messages, reversed so they come off the stack in order
         elif message_part.is_multipart():
-            for part in message_part.get_payload():
-                extract_parts(part)
-    
-    # Start extraction
-    if msg.is_multipart():
-        for part in msg.get_payload():
-            extract_parts(part)
-    else:
-        extract_parts(msg)
-    
-    # Add body to output
-    if body_text:
-        output.append("BODY:")
-        output.append("")
-        output.extend(body_text)
+            pending_parts.extend(reversed(message_part.get_payload()))
+            continue
+        
+        else:
+            continue
+        
+        if not body_started:
+            yield "BODY:\n"
+            yield "\n"
+            body_started = True
+        # Yielded separately so the body text is not copied just to append a newline
+        yield text
+        yield "\n"
     
     # Add attachment information
     if attachment_info:
-        output.append("")
-        output.append("-" * 80)
-        output.append("ATTACHMENTS:")
-        output.extend(attachment_info)
+        yield "\n"
+        yield "-" * 80 + "\n"
+        yield "ATTACHMENTS:\n"
+        for info in attachment_info:
+            yield info + "\n"
+
+
+def process_eml_file(eml_path, output_path=None, attachments_dir=None, extract_attachments=False):
+    """Process a single EML file and convert it to human-readable text
     
-    # Write to output file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(output))
+    The attachments directory is expected to exist already, convert_folder creates it.
+    """
+    eml_path = Path(eml_path)
+    if output_path is None:
+        output_path = eml_path.with_suffix('.txt')
+    
+    # Small files are parsed from a single read, larger ones are streamed through the parser
+    with open(eml_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size <= _MAX_SINGLE_READ_SIZE:
+            msg = _PARSER.parsebytes(f.read())
+        else:
+            msg = _PARSER.parse(f)
+    
+    # Stream the converted text into a temporary file instead of building it in memory, and
+    # only move it into place once complete so a failure leaves no truncated output behind
+    extracted_attachments = []
+    temp_path = f"{output_path}.tmp"
+    try:
+        with open(temp_path, 'w', encoding='utf-8', buffering=1 << 20) as out:
+            out.writelines(_emit_lines(msg, eml_path.name, attachments_dir, extract_attachments, extracted_attachments))
+        os.replace(temp_path, output_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
     
     return {
         'output_path': output_path,
@@ -241,7 +393,41 @@ def process_eml_file(eml_path, output_path=None, attachments_dir=None, extract_a
     }
 
 
-def convert_folder(folder_path, output_folder=None, attachments_folder=None, recursive=False, extract_attachments=False):
+def _iter_eml_files(folder, recursive, rel_dir=''):
+    """Yield (subfolder relative to the start folder, path) string pairs for all .eml files,
+    optionally descending into subfolders"""
+    try:
+        entries = os.scandir(folder)
+    except OSError:
+        # Skip unreadable subfolders like a glob would
+        return
+    
+    with entries:
+        for entry in entries:
+            # normcase makes the match case-insensitive on Windows, like a glob there
+            if os.path.normcase(entry.name).endswith('.eml') and entry.is_file():
+                yield rel_dir, entry.path
+            elif recursive and entry.is_dir(follow_symlinks=False):
+                yield from _iter_eml_files(entry.path, recursive, os.path.join(rel_dir, entry.name))
+
+
+def _process_one(task):
+    """Process a single EML file in a worker process, returning errors instead of raising"""
+    eml_file, output_path, attachments_dir, extract_attachments = task
+    try:
+        result = process_eml_file(
+            eml_file, 
+            output_path, 
+            attachments_dir=attachments_dir,
+            extract_attachments=extract_attachments
+        )
+        return eml_file, output_path, result, None
+    except Exception as e:
+        return eml_file, output_path, None, str(e)
+
+
+def convert_folder(folder_path, output_folder=None, attachments_folder=None, recursive=False, extract_attachments=False,
+                   jobs=None, chunksize=4):
     """Convert all .eml files in a folder to .txt files"""
     folder_path = Path(folder_path).resolve()
     
@@ -270,8 +456,7 @@ def convert_folder(folder_path, output_folder=None, attachments_folder=None, rec
         attachments_folder = None
     
     # Find all .eml files
-    pattern = '**/*.eml' if recursive else '*.eml'
-    eml_files = list(folder_path.glob(pattern))
+    eml_files = list(_iter_eml_files(str(folder_path), recursive))
     
     if not eml_files:
         print(f"No .eml files found in {folder_path}")
@@ -279,52 +464,82 @@ def convert_folder(folder_path, output_folder=None, attachments_folder=None, rec
     
     print(f"Found {len(eml_files)} .eml files to convert")
     
-    # Process each file
-    processed_files = []
-    total_attachments = 0
-    
-    for eml_file in eml_files:
-        try:
-            # Determine output path
-            if output_folder:
-                rel_path = eml_file.relative_to(folder_path)
-                # Handle subdirectories if recursive
-                if recursive and rel_path.parent != Path('.'):
-                    target_dir = output_folder / rel_path.parent
-                    target_dir.mkdir(parents=True, exist_ok=True)
-                    
-                    # Create subdirectory in attachments folder too if needed
-                    if extract_attachments and attachments_folder:
-                        attach_target_dir = attachments_folder / rel_path.parent
-                        attach_target_dir.mkdir(parents=True, exist_ok=True)
-                        current_attachments_dir = attach_target_dir
-                    else:
-                        current_attachments_dir = attachments_folder
+    # Determine output paths up front so the work can be handed to worker processes.
+    # Paths are kept as plain strings, and subdirectories are collected so each one is
+    # only created once instead of once per email.
+    output_folder = str(output_folder) if output_folder else None
+    attachments_folder = str(attachments_folder) if attachments_folder else None
+    tasks = []
+    target_dirs = set()
+    for rel_dir, eml_file in eml_files:
+        if output_folder:
+            # Handle subdirectories if recursive
+            if rel_dir:
+                target_dir = os.path.join(output_folder, rel_dir)
+                target_dirs.add(target_dir)
+                
+                # Create subdirectory in attachments folder too if needed
+                if extract_attachments and attachments_folder:
+                    current_attachments_dir = os.path.join(attachments_folder, rel_dir)
+                    target_dirs.add(current_attachments_dir)
                 else:
-                    target_dir = output_folder
                     current_attachments_dir = attachments_folder
-                
-                output_path = target_dir / f"{eml_file.stem}.txt"
             else:
-                output_path = eml_file.with_suffix('.txt')
+                target_dir = output_folder
                 current_attachments_dir = attachments_folder
             
-            result = process_eml_file(
-                eml_file, 
-                output_path, 
-                attachments_dir=current_attachments_dir,
-                extract_attachments=extract_attachments
-            )
-            
-            processed_files.append(result['output_path'])
-            num_attachments = len(result['extracted_attachments'])
-            total_attachments += num_attachments
-            
-            attachment_msg = f" ({num_attachments} attachments extracted)" if extract_attachments and num_attachments > 0 else ""
-            print(f"Converted: {eml_file.name} → {output_path.name}{attachment_msg}")
+            stem = os.path.splitext(os.path.basename(eml_file))[0]
+            output_path = os.path.join(target_dir, f"{stem}.txt")
+        else:
+            output_path = os.path.splitext(eml_file)[0] + '.txt'
+            current_attachments_dir = attachments_folder
+        
+        tasks.append((eml_file, output_path, current_attachments_dir, extract_attachments))
+    
+    # Progress messages are written in batches instead of one print per file
+    processed_files = []
+    total_attachments = 0
+    progress_lines = []
+    
+    # A subdirectory that cannot be created only fails the emails that go into it
+    failed_dirs = {}
+    for target_dir in target_dirs:
+        try:
+            os.makedirs(target_dir, exist_ok=True)
+        except OSError as e:
+            failed_dirs[target_dir] = e
+    
+    if failed_dirs:
+        runnable_tasks = []
+        for task in tasks:
+            eml_file, output_path, current_attachments_dir, _ = task
+            error = failed_dirs.get(os.path.dirname(output_path)) or failed_dirs.get(current_attachments_dir)
+            if error is not None:
+                progress_lines.append(f"Error processing {eml_file}: {error}")
+            else:
+                runnable_tasks.append(task)
+        tasks = runnable_tasks
+    
+    # Process files in parallel, each email is independent of the others.
+    # Small chunks keep all workers busy when a few large emails take much longer than the rest.
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for eml_file, output_path, result, error in executor.map(_process_one, tasks, chunksize=chunksize):
+            if error is not None:
+                progress_lines.append(f"Error processing {eml_file}: {error}")
+            else:
+                processed_files.append(result['output_path'])
+                num_attachments = len(result['extracted_attachments'])
+                total_attachments += num_attachments
+                
+                attachment_msg = f" ({num_attachments} attachments extracted)" if extract_attachments and num_attachments > 0 else ""
+                progress_lines.append(f"Converted: {os.path.basename(eml_file)} → {os.path.basename(output_path)}{attachment_msg}")
             
-        except Exception as e:
-            print(f"Error processing {eml_file}: {str(e)}")
+            if len(progress_lines) >= _PROGRESS_BATCH_SIZE:
+                sys.stdout.write('\n'.join(progress_lines) + '\n')
+                progress_lines.clear()
+    
+    if progress_lines:
+        sys.stdout.write('\n'.join(progress_lines) + '\n')
     
     if extract_attachments:
         print(f"\nTotal attachments extracted: {total_attachments}")
@@ -340,8 +555,15 @@ def main():
     parser.add_argument('-a', '--attachments', help='Folder for extracted attachments (default: attachments subfolder)')
     parser.add_argument('-r', '--recursive', action='store_true', help='Process subfolders recursively')
     parser.add_argument('-e', '--extract', action='store_true', help='Extract attachments from emails')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='Number of worker processes (default: number of CPUs)')
+    parser.add_argument('--chunksize', type=int, default=4, help='Number of emails handed to a worker at a time (default: 4)')
     args = parser.parse_args()
     
+    if args.jobs is not None and args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+    if args.chunksize < 1:
+        parser.error('--chunksize must be at least 1')
+    
     print("\nEML to TXT Converter")
     print("===================\n")
     
@@ -350,7 +572,9 @@ def main():
         args.output, 
         args.attachments, 
         args.recursive, 
-        args.extract
+        args.extract,
+        jobs=args.jobs,
+        chunksize=args.chunksize
     ):
         print("\nConversion completed successfully!")
         return 0